@@ -13,12 +13,12 @@ tools like ``set_view`` work end-to-end.
 """
 
 import asyncio
-import json
 import logging
 
 import fiftyone.operators as foo
 
 from .server import build_registry
+from .tools.utils import to_json
 
 
 logger = logging.getLogger(__name__)
@@ -70,11 +70,12 @@ class MCPToolExecutor(foo.Operator):
         entry = registry.get_tool(tool_name)
 
         if entry is None:
-            yield json.dumps(
+            yield to_json(
                 {
                     "success": False,
                     "error": "Unknown tool: %s" % tool_name,
-                }
+                },
+                indent=False,
             )
             return
 
@@ -92,7 +93,7 @@ class MCPToolExecutor(foo.Operator):
             for trigger in triggers:
                 yield trigger
 
-            yield json.dumps(result, indent=2)
+            yield to_json(result)
 
         except Exception as e:
             logger.error(
@@ -101,4 +102,4 @@ class MCPToolExecutor(foo.Operator):
                 e,
                 exc_info=True,
             )
-            yield json.dumps({"success": False, "error": str(e)})
+            yield to_json({"success": False, "error": str(e)}, indent=False)
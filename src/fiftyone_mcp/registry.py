@@ -12,23 +12,50 @@ server's if/elif chain.
 """
 
 import asyncio
-import json
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import logging
 from collections import namedtuple
 
 from mcp.types import TextContent
 
-from .tools.utils import APP, LOW, SDK, format_response
+from .tools.utils import APP, LOW, SDK, format_response, to_json
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_MODES = frozenset({SDK})
 _DEFAULT_RISK = LOW
 _DEFAULT_MAX_RESPONSE_CHARS = 200_000
+_MAX_HANDLER_WORKERS = 8
+
+# Sync handlers make blocking FiftyOne/MongoDB calls, so they run here
+# rather than on the event loop thread
+_HANDLER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_HANDLER_WORKERS, thread_name_prefix="fiftyone-mcp"
+)
 
 ToolResult = namedtuple("ToolResult", ["content", "triggers"])
 
 
+@functools.lru_cache(maxsize=128)
+def _unknown_tool_text(name):
+    # Clients may repeatedly probe for tools that don't exist, so the
+    # serialized error is cached per name
+    return to_json(
+        format_response(None, success=False, error="Unknown tool: %s" % name)
+    )
+
+
+def _text_content(text):
+    # ``text`` is always a JSON string produced by the registry itself, so
+    # pydantic validation is skipped
+    return TextContent.model_construct(type="text", text=text)
+
+
+def _error_result(text):
+    return ToolResult(content=[_text_content(text)], triggers=[])
+
+
 class ToolRegistry(object):
     """Central registry for MCP tools.
 
@@ -55,6 +82,7 @@ class ToolRegistry(object):
                 char limit for most deployments.
         """
         self._tools = {}
+        self._schemas = {}
         self._max_response_chars = max_response_chars
 
     def register(self, schema, handler):
@@ -71,7 +99,10 @@ class ToolRegistry(object):
             "handler": handler,
             "modes": modes,
             "risk": risk,
+            "app_only": modes == {APP},
+            "is_async": asyncio.iscoroutinefunction(handler),
         }
+        self._schemas.clear()
 
     def get_tool(self, name):
         """Returns the entry for the given tool name, or None.
@@ -80,14 +111,18 @@ class ToolRegistry(object):
             name: the tool name
 
         Returns:
-            a dict with ``schema``, ``handler``, and ``modes``
-            keys, or None
+            a dict with ``schema``, ``handler``, ``modes``,
+            ``risk``, ``app_only``, and ``is_async`` keys, or None
         """
         return self._tools.get(name)
 
     def list_tools(self, mode=None):
         """Returns registered MCP tool schemas.
 
+        The returned list is built once per ``mode`` and reused until
+        the next call to :meth:`register`, so callers must not mutate
+        it.
+
         Args:
             mode (None): an optional mode string (``"sdk"``,
                 ``"app"``, or ``"session"``).  When provided,
@@ -96,12 +131,19 @@ class ToolRegistry(object):
         Returns:
             a list of :class:`mcp.types.Tool` instances
         """
+        schemas = self._schemas.get(mode)
+        if schemas is not None:
+            return schemas
+
         if mode is not None:
-            return [
+            schemas = [
                 t["schema"] for t in self._tools.values() if mode in t["modes"]
             ]
+        else:
+            schemas = [t["schema"] for t in self._tools.values()]
 
-        return [t["schema"] for t in self._tools.values()]
+        self._schemas[mode] = schemas
+        return schemas
 
     async def call_tool(self, name, arguments, ctx=None):
         """Dispatches a tool call by name.
@@ -111,7 +153,9 @@ class ToolRegistry(object):
         a structured error is returned before the handler is
         called.
 
-        Handles both sync and async handlers transparently.
+        Handles both sync and async handlers transparently. Sync
+        handlers are run in a bounded thread pool so that blocking
+        database calls do not stall other requests.
 
         Handlers may include a ``_triggers`` key in their
         response dict containing a list of
@@ -135,23 +179,10 @@ class ToolRegistry(object):
         """
         entry = self._tools.get(name)
         if entry is None:
-            result = format_response(
-                None,
-                success=False,
-                error="Unknown tool: %s" % name,
-            )
-            return ToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ],
-                triggers=[],
-            )
+            return _error_result(_unknown_tool_text(name))
 
         # Guard: App-only tools require ctx.ops
-        if entry["modes"] == {APP}:
+        if entry["app_only"]:
             if ctx is None or not hasattr(ctx, "ops"):
                 result = format_response(
                     None,
@@ -161,18 +192,18 @@ class ToolRegistry(object):
                         "context. Call via MCPToolExecutor." % name
                     ),
                 )
-                return ToolResult(
-                    content=[
-                        TextContent(
-                            type="text",
-                            text=json.dumps(result, indent=2),
-                        )
-                    ],
-                    triggers=[],
-                )
+                return _error_result(to_json(result))
 
         try:
-            result = entry["handler"](ctx, **(arguments or {}))
+            handler = entry["handler"]
+            if entry["is_async"]:
+                result = await handler(ctx, **(arguments or {}))
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    _HANDLER_EXECUTOR,
+                    functools.partial(handler, ctx, **(arguments or {})),
+                )
+
             if asyncio.iscoroutine(result):
                 result = await result
 
@@ -183,7 +214,7 @@ class ToolRegistry(object):
                 triggers = result.pop("_triggers", [])
                 allow_large = result.pop("_allow_large", False)
 
-            text = json.dumps(result, indent=2)
+            text = to_json(result)
             if len(text) > self._max_response_chars and not allow_large:
                 logger.warning(
                     "Tool '%s' response too large (%d chars), truncating",
@@ -201,10 +232,10 @@ class ToolRegistry(object):
                     _truncated=True,
                     _original_size=len(text),
                 )
-                text = json.dumps(result, indent=2)
+                text = to_json(result)
 
             return ToolResult(
-                content=[TextContent(type="text", text=text)],
+                content=[_text_content(text)],
                 triggers=triggers,
             )
         except Exception as e:
@@ -212,12 +243,4 @@ class ToolRegistry(object):
                 "Error executing tool '%s': %s", name, e, exc_info=True
             )
             result = format_response(None, success=False, error=str(e))
-            return ToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ],
-                triggers=[],
-            )
+            return _error_result(to_json(result))
@@ -9,6 +9,7 @@ Main entrypoint for the FiftyOne Model Context Protocol server.
 """
 
 import asyncio
+import functools
 import json
 import logging
 from pathlib import Path
@@ -70,9 +71,13 @@ def build_registry(config=None):
     return registry
 
 
+@functools.lru_cache(maxsize=1)
 def load_config():
     """Loads configuration from settings.json.
 
+    The parsed config is cached, so the file is read at most once per
+    process. Callers must not mutate the returned dict.
+
     Returns:
         a config dict
     """
@@ -8,15 +8,32 @@ Aggregation tools for FiftyOne MCP server.
 
 import logging
 
-import fiftyone as fo
 from mcp.types import Tool
 
-from .utils import SDK, _get_view, format_response, mcp_tool, safe_serialize
+from .utils import (
+    SDK,
+    _get_view,
+    format_response,
+    get_dataset,
+    mcp_tool,
+    safe_serialize,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Shared by the input schemas of every aggregation tool
+_VIEW_STAGES_PROPERTY = {
+    "type": "array",
+    "items": {"type": "object"},
+    "description": (
+        "Optional list of serialized view stage dicts to pre-filter the "
+        "dataset"
+    ),
+}
+
+
 @mcp_tool(SDK)
 def count_values(ctx, dataset_name, field, view_stages=None):
     """Counts the occurrences of each value for a field.
@@ -33,7 +50,7 @@ def count_values(ctx, dataset_name, field, view_stages=None):
         a dict with field value counts
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
         counts = view.count_values(field)
 
@@ -67,7 +84,7 @@ def distinct(ctx, dataset_name, field, view_stages=None):
         a dict with the list of unique values
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
         values = view.distinct(field)
 
@@ -100,7 +117,7 @@ def compute_bounds(ctx, dataset_name, field, view_stages=None):
         a dict with min and max values for the field
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
         mn, mx = view.bounds(field)
 
@@ -127,7 +144,7 @@ def compute_mean(ctx, dataset_name, field, view_stages=None):
         a dict with the mean value for the field
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
         result = view.mean(field)
 
@@ -154,7 +171,7 @@ def compute_sum(ctx, dataset_name, field, view_stages=None):
         a dict with the sum value for the field
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
         result = view.sum(field)
 
@@ -181,7 +198,7 @@ def compute_std(ctx, dataset_name, field, view_stages=None):
         a dict with the standard deviation for the field
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
         result = view.std(field)
 
@@ -218,7 +235,7 @@ def histogram_values(
         a dict with counts, edges, and out-of-range count
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
 
         kwargs = {"bins": bins}
@@ -260,7 +277,7 @@ def get_values(ctx, dataset_name, field, view_stages=None, limit=10000):
         a dict with the list of field values
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         view = _get_view(dataset, view_stages)
 
         truncated = False
@@ -315,14 +332,7 @@ def register_tools(registry):
                             "'ground_truth.label')"
                         ),
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                 },
                 "required": ["dataset_name", "field"],
             },
@@ -354,14 +364,7 @@ def register_tools(registry):
                             "for (e.g., 'ground_truth.label')"
                         ),
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                 },
                 "required": ["dataset_name", "field"],
             },
@@ -393,14 +396,7 @@ def register_tools(registry):
                             ".confidence')"
                         ),
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                 },
                 "required": ["dataset_name", "field"],
             },
@@ -428,14 +424,7 @@ def register_tools(registry):
                         "type": "string",
                         "description": "Numeric field path",
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                 },
                 "required": ["dataset_name", "field"],
             },
@@ -461,14 +450,7 @@ def register_tools(registry):
                         "type": "string",
                         "description": "Numeric field path",
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                 },
                 "required": ["dataset_name", "field"],
             },
@@ -494,14 +476,7 @@ def register_tools(registry):
                         "type": "string",
                         "description": "Numeric field path",
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                 },
                 "required": ["dataset_name", "field"],
             },
@@ -549,14 +524,7 @@ def register_tools(registry):
                             "full range is used"
                         ),
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                 },
                 "required": ["dataset_name", "field"],
             },
@@ -588,14 +556,7 @@ def register_tools(registry):
                             "(e.g., 'uniqueness', 'my_score')"
                         ),
                     },
-                    "view_stages": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": (
-                            "Optional list of serialized view "
-                            "stage dicts to pre-filter the dataset"
-                        ),
-                    },
+                    "view_stages": _VIEW_STAGES_PROPERTY,
                     "limit": {
                         "type": "integer",
                         "description": (
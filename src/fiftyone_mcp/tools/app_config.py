@@ -11,7 +11,7 @@ import logging
 import fiftyone as fo
 from mcp.types import Tool
 
-from .utils import SDK, format_response, mcp_tool
+from .utils import SDK, format_response, get_dataset, mcp_tool
 
 
 logger = logging.getLogger(__name__)
@@ -115,7 +115,7 @@ def get_app_config(ctx, dataset_name):
         a dict with the full app config
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         return format_response(
             {
                 "dataset_name": dataset_name,
@@ -144,7 +144,7 @@ def get_color_scheme(ctx, dataset_name):
         a dict with the color scheme
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         return format_response(
             {
                 "dataset_name": dataset_name,
@@ -184,7 +184,7 @@ def set_color_scheme(
         a dict with the updated color scheme
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         dataset.app_config.color_scheme = fo.ColorScheme(
             color_by=color_by,
             color_pool=color_pool,
@@ -221,7 +221,7 @@ def get_sidebar_groups(ctx, dataset_name):
         a dict with the sidebar groups list
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         groups = dataset.app_config.sidebar_groups
         return format_response(
             {
@@ -256,7 +256,7 @@ def set_sidebar_groups(ctx, dataset_name, groups):
         a dict with the updated sidebar groups
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         dataset.app_config.sidebar_groups = [
             fo.SidebarGroupDocument(
                 name=g["name"],
@@ -299,7 +299,7 @@ def set_active_fields(ctx, dataset_name, paths, exclude=False):
         a dict with the updated active fields config
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         dataset.app_config.active_fields = fo.ActiveFields(
             paths=paths,
             exclude=exclude,
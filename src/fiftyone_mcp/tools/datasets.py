@@ -6,7 +6,10 @@ Dataset management tools for FiftyOne MCP server.
 |
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
 
 import fiftyone as fo
 from mcp.types import Tool
@@ -14,8 +17,9 @@ from mcp.types import Tool
 from .utils import (
     SDK,
     format_response,
+    get_dataset,
+    json_safe,
     mcp_tool,
-    safe_serialize,
     dataset_to_summary,
 )
 
@@ -23,10 +27,50 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+# Bounds concurrent database work when counting samples for listings
+_MAX_LOAD_WORKERS = 8
+
+_MAX_CACHED_SUMMARIES = 32
+_summary_cache = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+
+def _get_dataset_info(info):
+    """Builds the listing metadata for a dataset.
+
+    ``fo.list_datasets(info=True)`` does not report sample counts, so the
+    dataset is loaded to count its samples.
+
+    Args:
+        info: an info dict from ``fo.list_datasets(info=True)``
+
+    Returns:
+        a metadata dict, or a dict with an ``error`` key if the dataset
+        could not be loaded or counted
+    """
+    name = info["name"]
+
+    try:
+        dataset = fo.load_dataset(name)
+        return {
+            "name": name,
+            "media_type": info["media_type"],
+            "num_samples": len(dataset),
+            "persistent": info["persistent"],
+            "tags": info["tags"],
+        }
+    except Exception as e:
+        logger.warning("Could not load dataset '%s': %s", name, e)
+        return {"name": name, "error": str(e)}
+
+
 @mcp_tool(SDK)
 def list_datasets(ctx):
     """Lists all available FiftyOne datasets.
 
+    Dataset metadata is read in a single query, and the datasets are then
+    loaded in parallel to count their samples.
+
     Args:
         ctx: an optional
             :class:`fiftyone.operators.executor.ExecutionContext`
@@ -35,27 +79,14 @@ def list_datasets(ctx):
         a dict containing list of dataset names and metadata
     """
     try:
-        datasets = fo.list_datasets()
-        dataset_info = []
-
-        for name in datasets:
-            try:
-                dataset = fo.load_dataset(name)
-                dataset_info.append(
-                    {
-                        "name": name,
-                        "media_type": dataset.media_type,
-                        "num_samples": len(dataset),
-                        "persistent": dataset.persistent,
-                        "tags": dataset.tags,
-                    }
-                )
-            except Exception as e:
-                logger.warning("Could not load dataset '%s': %s", name, e)
-                dataset_info.append({"name": name, "error": str(e)})
+        infos = sorted(fo.list_datasets(info=True), key=lambda i: i["name"])
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_LOAD_WORKERS, max(len(infos), 1))
+        ) as executor:
+            dataset_info = list(executor.map(_get_dataset_info, infos))
 
         return format_response(
-            {"count": len(datasets), "datasets": dataset_info}
+            {"count": len(dataset_info), "datasets": dataset_info}
         )
 
     except Exception as e:
@@ -76,7 +107,7 @@ def load_dataset(ctx, name):
         a dict containing dataset information
     """
     try:
-        dataset = fo.load_dataset(name)
+        dataset = get_dataset(name)
 
         info = {
             "name": dataset.name,
@@ -84,7 +115,7 @@ def load_dataset(ctx, name):
             "num_samples": len(dataset),
             "persistent": dataset.persistent,
             "tags": dataset.tags,
-            "info": safe_serialize(dataset.info),
+            "info": json_safe(dataset.info),
             "fields": list(dataset.get_field_schema().keys()),
         }
 
@@ -95,10 +126,76 @@ def load_dataset(ctx, name):
         return format_response(None, success=False, error=str(e))
 
 
+_SKIP_VALUE_COUNT_FIELDS = {"id", "filepath", "metadata"}
+
+
+def _is_countable_field(field):
+    if isinstance(field, fo.ListField):
+        field = field.field
+
+    # Only categorical fields are likely to have few enough distinct values
+    # to be reported, so don't spend aggregations on the others
+    return isinstance(field, (fo.StringField, fo.BooleanField, fo.IntField))
+
+
+def _count_values(dataset, field_names):
+    """Computes value counts for the given fields.
+
+    All counts are computed in a single batched aggregation. If that fails,
+    the fields are counted individually so that one bad field does not
+    drop the others; fields that cannot be counted yield None.
+    """
+    aggs = [fo.CountValues(field_name) for field_name in field_names]
+
+    try:
+        return dataset.aggregate(aggs)
+    except Exception as e:
+        logger.debug("Batched value counts failed, retrying per field: %s", e)
+
+    results = []
+    for agg in aggs:
+        try:
+            results.append(dataset.aggregate(agg))
+        except Exception:
+            results.append(None)
+
+    return results
+
+
+def _get_samples_last_modified_at(dataset):
+    # last_modified_at is indexed, so this reads a single index entry
+    # rather than scanning the collection
+    values = (
+        dataset.sort_by("last_modified_at", reverse=True)
+        .limit(1)
+        .values("last_modified_at")
+    )
+    return values[0] if values else None
+
+
+def _get_cached_summary(key):
+    with _summary_cache_lock:
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            _summary_cache.move_to_end(key)
+
+        return summary
+
+
+def _cache_summary(key, summary):
+    with _summary_cache_lock:
+        _summary_cache[key] = summary
+        while len(_summary_cache) > _MAX_CACHED_SUMMARIES:
+            _summary_cache.popitem(last=False)
+
+
 @mcp_tool(SDK)
 def dataset_summary(ctx, name):
     """Gets detailed summary statistics for a dataset.
 
+    Summaries are cached until the dataset or any of its samples are
+    modified.
+
     Args:
         ctx: an optional
             :class:`fiftyone.operators.executor.ExecutionContext`
@@ -108,41 +205,58 @@ def dataset_summary(ctx, name):
         a dict containing detailed dataset statistics
     """
     try:
-        dataset = fo.load_dataset(name)
-        summary = dataset_to_summary(dataset)
+        dataset = get_dataset(name)
+
+        # get_dataset() reloads the dataset, so these timestamps reflect
+        # changes made by other processes. Dataset.last_modified_at does
+        # not track sample edits, so the latest sample edit and deletion
+        # are part of the cache key too
+        key = (
+            name,
+            dataset.last_modified_at,
+            dataset.last_deletion_at,
+            _get_samples_last_modified_at(dataset),
+        )
 
+        summary = _get_cached_summary(key)
+        if summary is not None:
+            return format_response(summary)
+
+        num_samples = len(dataset)
+        schema = dataset.get_field_schema()
+        summary = dataset_to_summary(
+            dataset, num_samples=num_samples, schema=schema
+        )
+
+        field_names = [
+            field_name
+            for field_name, field in schema.items()
+            if field_name not in _SKIP_VALUE_COUNT_FIELDS
+            and _is_countable_field(field)
+        ]
+        all_counts = dict(
+            zip(field_names, _count_values(dataset, field_names))
+        )
+
+        tag_counts = all_counts.get("tags") or {}
         summary["stats"] = {
-            "total_samples": len(dataset),
-            "tags": {},
+            "total_samples": num_samples,
+            "tags": {tag: tag_counts.get(tag, 0) for tag in dataset.tags},
         }
 
-        for tag in dataset.tags:
-            tagged_view = dataset.match_tags(tag)
-            summary["stats"]["tags"][tag] = len(tagged_view)
-
-        schema = dataset.get_field_schema()
         summary["value_counts"] = {}
-
-        for field_name in schema.keys():
-            if field_name in ["id", "filepath", "metadata"]:
-                continue
-
-            try:
-                if hasattr(dataset, "count_values"):
-                    counts = dataset.count_values(field_name)
-                    if counts and len(counts) < 100:
-                        summary["value_counts"][field_name] = {
-                            (
-                                k
-                                if isinstance(
-                                    k, (str, int, float, bool, type(None))
-                                )
-                                else str(k)
-                            ): v
-                            for k, v in counts.items()
-                        }
-            except Exception:
-                pass
+        for field_name, counts in all_counts.items():
+            if counts and len(counts) < 100:
+                summary["value_counts"][field_name] = {
+                    (
+                        k
+                        if isinstance(k, (str, int, float, bool, type(None)))
+                        else str(k)
+                    ): v
+                    for k, v in counts.items()
+                }
+
+        _cache_summary(key, summary)
 
         return format_response(summary)
 
@@ -10,11 +10,10 @@ for FiftyOne MCP server.
 import logging
 
 from bson import ObjectId
-import fiftyone as fo
 from fiftyone.operators.store import ExecutionStore
 from mcp.types import Tool
 
-from .utils import SDK, format_response, mcp_tool, safe_serialize
+from .utils import SDK, format_response, get_dataset, mcp_tool, safe_serialize
 
 
 logger = logging.getLogger(__name__)
@@ -42,7 +41,7 @@ def list_brain_runs(ctx, dataset_name, run_type=None, method=None):
         a dict with the list of brain run keys
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         runs = dataset.list_brain_runs(type=run_type, method=method)
 
         return format_response(
@@ -81,7 +80,7 @@ def list_evaluations(ctx, dataset_name, eval_type=None, method=None):
         a dict with the list of evaluation keys
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         evals = dataset.list_evaluations(type=eval_type, method=method)
 
         return format_response(
@@ -123,7 +122,7 @@ def list_me_scenarios(ctx, dataset_name):
         a dict with the scenarios mapping
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         dataset_oid = ObjectId(str(dataset._doc.id))
         store = ExecutionStore.create(_ME_STORE_NAME, dataset_oid)
         scenarios = store.get("scenarios") or {}
@@ -23,9 +23,12 @@ is available:
 |
 """
 
+from collections import OrderedDict
+import json
 import logging
 import re
-import traceback
+import threading
+import time
 
 from eta.core.utils import PackageError
 from fiftyone.operators import registry as op_registry
@@ -42,8 +45,9 @@ from .utils import (
     OPERATOR,
     SDK,
     format_response,
+    format_traceback,
+    json_safe,
     mcp_tool,
-    safe_serialize,
 )
 
 logger = logging.getLogger(__name__)
@@ -64,6 +68,16 @@ _CHOICE_KEEP = frozenset({"value", "label", "description"})
 
 _MAX_CHOICES = 20
 
+_MISSING_DEP_RE = re.compile(r"requires that ['\"]([^'\"]+)['\"] is installed")
+
+# Enumerating operators scans every plugin, so lookups for the read-only
+# tools are cached briefly. Plugin tools clear the cache when they change
+# which operators are available
+_OPERATOR_CACHE_TTL = 30
+_MAX_CACHED_OPERATOR_LOOKUPS = 256
+_operator_cache = OrderedDict()
+_operator_cache_lock = threading.Lock()
+
 
 def _strip_view(view):
     if not isinstance(view, dict):
@@ -191,10 +205,7 @@ def _build_dependency_error_response(error, operator_uri):
     """
     error_str = str(error)
 
-    match = re.search(
-        r"requires that ['\"]([^'\"]+)['\"] is installed",
-        error_str,
-    )
+    match = _MISSING_DEP_RE.search(error_str)
     package = match.group(1) if match else "unknown"
 
     return format_response(
@@ -210,6 +221,55 @@ def _build_dependency_error_response(error, operator_uri):
     )
 
 
+def _get_cached(key, fn):
+    now = time.monotonic()
+    with _operator_cache_lock:
+        entry = _operator_cache.get(key)
+        if entry is not None and now - entry[0] < _OPERATOR_CACHE_TTL:
+            _operator_cache.move_to_end(key)
+            return entry[1]
+
+    value = fn()
+
+    with _operator_cache_lock:
+        expired = [
+            k
+            for k, (t, _) in _operator_cache.items()
+            if now - t >= _OPERATOR_CACHE_TTL
+        ]
+        for k in expired:
+            del _operator_cache[k]
+
+        _operator_cache[key] = (now, value)
+        _operator_cache.move_to_end(key)
+        while len(_operator_cache) > _MAX_CACHED_OPERATOR_LOOKUPS:
+            _operator_cache.popitem(last=False)
+
+    return value
+
+
+def _find_operator(operator_uri):
+    try:
+        return op_registry.get_operator(operator_uri)
+    except ValueError:
+        return None
+
+
+def _get_operator(operator_uri):
+    # Unknown URIs are cached as None so that repeat misses are cheap too
+    return _get_cached(
+        ("get", operator_uri), lambda: _find_operator(operator_uri)
+    )
+
+
+def clear_operator_cache():
+    """Clears the cached operator lookups and resolved input schemas used
+    by :func:`list_operators` and :func:`get_operator_schema`.
+    """
+    with _operator_cache_lock:
+        _operator_cache.clear()
+
+
 def _get_request_params(ctx, dataset_name=None):
     """Builds request_params from ctx or dataset_name.
 
@@ -257,8 +317,43 @@ def _get_execution_context(ctx, dataset_name=None, params=None):
     return None
 
 
+_OPERATOR_KEYS = (
+    "uri",
+    "name",
+    "label",
+    "description",
+    "plugin_name",
+    "builtin",
+    "dynamic",
+    "allow_delegated_execution",
+    "allow_immediate_execution",
+)
+
+
+def _serialize_operator(op):
+    return {
+        "uri": op.uri,
+        "name": op.name,
+        "label": op.config.label,
+        "description": op.config.description,
+        "plugin_name": op.plugin_name,
+        "builtin": op.builtin,
+        "dynamic": op.config.dynamic,
+        "allow_delegated_execution": op.config.allow_delegated_execution,
+        "allow_immediate_execution": op.config.allow_immediate_execution,
+    }
+
+
 @mcp_tool(SDK)
-def list_operators(ctx, builtin_only=None, operator_type=None):
+def list_operators(  # pylint: disable=too-many-positional-arguments
+    ctx,
+    builtin_only=None,
+    operator_type=None,
+    limit=None,
+    offset=0,
+    fields=None,
+    output_format="objects",
+):
     """Lists all available FiftyOne operators.
 
     Args:
@@ -266,10 +361,50 @@ def list_operators(ctx, builtin_only=None, operator_type=None):
             :class:`fiftyone.operators.executor.ExecutionContext`
         builtin_only (None): if True, only builtin operators
         operator_type (None): filter by type
+        limit (None): an optional maximum number of operators to return
+        offset (0): the number of operators to skip
+        fields (None): an optional list of operator keys to include. By
+            default, all keys are included
+        output_format ("objects"): the format of the returned operators.
+            Supported values are ``"objects"``, a list of dicts, and
+            ``"columnar"``, a ``{"keys": [...], "rows": [[...], ...]}``
+            dict in which each row lists values in ``keys`` order
 
     Returns:
         a dict containing list of operators
     """
+    if limit is not None and limit < 1:
+        return format_response(
+            None, success=False, error="limit must be at least 1"
+        )
+
+    if offset < 0:
+        return format_response(
+            None, success=False, error="offset must be non-negative"
+        )
+
+    if fields:
+        unknown = [k for k in fields if k not in _OPERATOR_KEYS]
+        if unknown:
+            return format_response(
+                None,
+                success=False,
+                error=(
+                    "Unknown operator fields %s. Supported fields are %s"
+                    % (unknown, list(_OPERATOR_KEYS))
+                ),
+            )
+
+    if output_format not in ("objects", "columnar"):
+        return format_response(
+            None,
+            success=False,
+            error=(
+                "Unsupported output_format '%s'. Supported values are "
+                "'objects' and 'columnar'" % output_format
+            ),
+        )
+
     try:
         builtin = "all"
         if builtin_only is True:
@@ -277,34 +412,38 @@ def list_operators(ctx, builtin_only=None, operator_type=None):
         elif builtin_only is False:
             builtin = False
 
-        operators = op_registry.list_operators(
-            enabled=True, builtin=builtin, type=operator_type
+        operator_list = _get_cached(
+            ("list", builtin, operator_type),
+            lambda: [
+                _serialize_operator(op)
+                for op in op_registry.list_operators(
+                    enabled=True, builtin=builtin, type=operator_type
+                )
+            ],
         )
 
-        operator_list = []
-        for op in operators:
-            operator_list.append(
-                {
-                    "uri": op.uri,
-                    "name": op.name,
-                    "label": op.config.label,
-                    "description": op.config.description,
-                    "plugin_name": op.plugin_name,
-                    "builtin": op.builtin,
-                    "dynamic": op.config.dynamic,
-                    "allow_delegated_execution": (
-                        op.config.allow_delegated_execution
-                    ),
-                    "allow_immediate_execution": (
-                        op.config.allow_immediate_execution
-                    ),
-                }
-            )
+        total = len(operator_list)
+        if offset or limit:
+            stop = offset + limit if limit is not None else None
+            operator_list = operator_list[offset:stop]
+
+        keys = list(fields) if fields else list(_OPERATOR_KEYS)
+
+        if output_format == "columnar":
+            operators = {
+                "keys": keys,
+                "rows": [[op[k] for k in keys] for op in operator_list],
+            }
+        elif fields:
+            operators = [{k: op[k] for k in keys} for op in operator_list]
+        else:
+            operators = operator_list
 
         return format_response(
             {
                 "count": len(operator_list),
-                "operators": operator_list,
+                "total": total,
+                "operators": operators,
             }
         )
 
@@ -342,7 +481,7 @@ def get_operator_schema(
         a dict containing the operator's input schema
     """
     try:
-        operator = op_registry.get_operator(operator_uri)
+        operator = _get_operator(operator_uri)
         if operator is None:
             return format_response(
                 None,
@@ -371,11 +510,30 @@ def get_operator_schema(
             exec_ctx.request_params["params"] = params
             exec_ctx.params = params
 
-        input_property = operator.resolve_input(exec_ctx)
-        schema = input_property.to_json() if input_property else {}
+        def _resolve():
+            input_property = operator.resolve_input(exec_ctx)
+            schema = input_property.to_json() if input_property else {}
+            return schema if verbose else _strip_schema(schema)
 
-        if not verbose:
-            schema = _strip_schema(schema)
+        if exec_ctx is ctx or operator.config.dynamic:
+            schema = _resolve()
+        else:
+            # Dynamic operators may resolve their inputs from sample-level
+            # state, so they are never cached. Otherwise the SDK mode
+            # schema only depends on the operator, the dataset, and the
+            # params. The execution context reloads its dataset, so
+            # last_modified_at is current
+            schema = _get_cached(
+                (
+                    "schema",
+                    operator_uri,
+                    dataset_name,
+                    exec_ctx.dataset.last_modified_at,
+                    json.dumps(params, sort_keys=True, default=str),
+                    verbose,
+                ),
+                _resolve,
+            )
 
         result = format_response(
             {
@@ -419,7 +577,7 @@ def _queue_delegated_operator(
         if delegation_target:
             request_params["delegation_target"] = delegation_target
 
-        label = operator_uri.split("/")[-1]
+        label = operator_uri.rpartition("/")[2]
 
         svc = DelegatedOperationService()
         op = svc.queue_operation(
@@ -449,7 +607,7 @@ def _queue_delegated_operator(
             None,
             success=False,
             error=str(e),
-            traceback=traceback.format_exc(),
+            traceback=format_traceback(),
         )
 
 
@@ -488,7 +646,7 @@ async def execute_operator(
         a dict containing execution result
     """
     try:
-        operator = op_registry.get_operator(operator_uri)
+        operator = _get_operator(operator_uri)
         if operator is None:
             return format_response(
                 None,
@@ -542,7 +700,7 @@ async def execute_operator(
                 "success": True,
                 "delegated": False,
                 "result": (
-                    safe_serialize(execution_result.result)
+                    json_safe(execution_result.result)
                     if execution_result
                     else None
                 ),
@@ -562,7 +720,7 @@ async def execute_operator(
             None,
             success=False,
             error=str(e),
-            traceback=traceback.format_exc(),
+            traceback=format_traceback(),
         )
 
 
@@ -610,6 +768,43 @@ def register_tools(registry):
                             "to return all types."
                         ),
                     },
+                    "limit": {
+                        "type": "integer",
+                        "description": (
+                            "Maximum number of operators to "
+                            "return. Omit to return all."
+                        ),
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": (
+                            "Number of operators to skip, for "
+                            "paging through results"
+                        ),
+                        "default": 0,
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "Operator keys to include (e.g., "
+                            "['uri', 'label']). Omit to include "
+                            "all keys."
+                        ),
+                    },
+                    "output_format": {
+                        "type": "string",
+                        "enum": ["objects", "columnar"],
+                        "description": (
+                            "'objects' (default) returns a list "
+                            "of operator dicts. 'columnar' "
+                            "returns {keys, rows}, where each "
+                            "row lists one operator's values in "
+                            "the order of keys; use it to keep "
+                            "large listings small."
+                        ),
+                        "default": "objects",
+                    },
                 },
             },
         ),
@@ -15,22 +15,21 @@ makes reach the connected browser. In SDK mode (``ctx`` is
 """
 
 import logging
-import traceback
 
-from fiftyone.operators import registry as op_registry
 from fiftyone.operators.executor import (
     execute_or_delegate_operator,
 )
 from mcp.types import Tool
 
-from .operators import _get_request_params
+from .operators import _get_operator, _get_request_params
 from .utils import (
     APP,
     OPERATOR,
     SDK,
     format_response,
+    format_traceback,
+    json_safe,
     mcp_tool,
-    safe_serialize,
 )
 
 logger = logging.getLogger(__name__)
@@ -159,7 +158,7 @@ def _validate_pipeline_stages(stages):
                 error=("Stage %d is missing 'operator_uri'" % idx),
             )
 
-        operator = op_registry.get_operator(uri)
+        operator = _get_operator(uri)
         if operator is None:
             return format_response(
                 None,
@@ -223,10 +222,27 @@ async def execute_pipeline(
             None,
             success=False,
             error=str(e),
-            traceback=traceback.format_exc(),
+            traceback=format_traceback(),
         )
 
 
+def _stage_name(idx, stage):
+    return stage.get("name") or (
+        "stage_%d_%s" % (idx, stage["operator_uri"].rpartition("/")[2])
+    )
+
+
+def _skipped_stage_result(idx, uri, name):
+    return {
+        "index": idx,
+        "operator_uri": uri,
+        "name": name,
+        "success": False,
+        "skipped": True,
+        "reason": "Previous stage failed",
+    }
+
+
 async def _execute_pipeline_immediate(stages, request_params, ctx=None):
     """Executes pipeline stages immediately and sequentially.
 
@@ -251,22 +267,13 @@ async def _execute_pipeline_immediate(stages, request_params, ctx=None):
 
     for idx, stage in enumerate(stages):
         uri = stage["operator_uri"]
-        name = stage.get("name") or ("stage_%d_%s" % (idx, uri.split("/")[-1]))
+        name = _stage_name(idx, stage)
         params = stage.get("params") or {}
         always_run = stage.get("always_run", False)
 
         if not active and not always_run:
             stages_skipped += 1
-            results.append(
-                {
-                    "index": idx,
-                    "operator_uri": uri,
-                    "name": name,
-                    "success": False,
-                    "skipped": True,
-                    "reason": "Previous stage failed",
-                }
-            )
+            results.append(_skipped_stage_result(idx, uri, name))
             continue
 
         try:
@@ -302,7 +309,7 @@ async def _execute_pipeline_immediate(stages, request_params, ctx=None):
                         "success": True,
                         "skipped": False,
                         "result": (
-                            safe_serialize(execution_result.result)
+                            json_safe(execution_result.result)
                             if execution_result
                             else None
                         ),
@@ -323,6 +330,18 @@ async def _execute_pipeline_immediate(stages, request_params, ctx=None):
                 }
             )
 
+            # Without a later always_run stage, everything else is skipped
+            remaining = stages[idx + 1 :]
+            if not any(s.get("always_run", False) for s in remaining):
+                results.extend(
+                    _skipped_stage_result(
+                        i, s["operator_uri"], _stage_name(i, s)
+                    )
+                    for i, s in enumerate(remaining, idx + 1)
+                )
+                stages_skipped += len(remaining)
+                break
+
     stages_executed = len(stages) - stages_skipped
 
     return format_response(
@@ -377,7 +396,7 @@ async def _execute_pipeline_delegated(
             rp["delegation_target"] = delegation_target
 
         pipeline_label = "pipeline:%s_+%d_more" % (
-            stages[0]["operator_uri"].split("/")[-1],
+            stages[0]["operator_uri"].rpartition("/")[2],
             len(stages) - 1,
         )
 
@@ -416,7 +435,7 @@ async def _execute_pipeline_delegated(
             None,
             success=False,
             error=str(e),
-            traceback=traceback.format_exc(),
+            traceback=format_traceback(),
         )
 
 
@@ -11,6 +11,7 @@ import logging
 import fiftyone.plugins as fop
 from mcp.types import Tool
 
+from .operators import clear_operator_cache
 from .utils import SDK, format_response, mcp_tool
 
 
@@ -18,28 +19,58 @@ logger = logging.getLogger(__name__)
 
 
 @mcp_tool(SDK)
-def list_plugins(ctx, enabled=None):
+def list_plugins(ctx, enabled=None, detail=True):
     """Lists available FiftyOne plugins.
 
     Args:
         ctx: an optional
             :class:`fiftyone.operators.executor.ExecutionContext`
         enabled (None): whether to list only enabled plugins
+        detail (True): whether to include each plugin's metadata. If
+            False, only plugin names are returned, without parsing any
+            plugin definitions. Either way, the same plugins are listed;
+            with details, plugins that fail to load have an ``error``
+            entry
 
     Returns:
         a dict with success status and plugin data
     """
     try:
+        # Names are listed without parsing plugin definitions, so plugins
+        # whose definitions fail to load are included either way
         if enabled is None:
-            plugins = fop.list_downloaded_plugins()
+            names = fop.list_downloaded_plugins()
+        elif enabled:
+            names = fop.list_enabled_plugins()
         else:
-            plugins = fop.list_plugins(enabled=enabled)
+            names = fop.list_disabled_plugins()
+
+        if not detail:
+            return format_response(
+                {
+                    "plugins": [{"name": name} for name in names],
+                    "count": len(names),
+                },
+                success=True,
+            )
+
+        # fop.get_plugin() rescans the plugins directory on every call, so
+        # load all definitions in one pass and only fall back to it for
+        # plugins that failed to load, to surface their errors
+        definitions = {
+            p.name: p
+            for p in fop.list_plugins(
+                enabled="all" if enabled is None else enabled
+            )
+        }
 
         plugin_list = []
-        for item in plugins:
-            plugin_name = item if isinstance(item, str) else item.name
+        for plugin_name in names:
             try:
-                plugin = fop.get_plugin(plugin_name)
+                plugin = definitions.get(plugin_name)
+                if plugin is None:
+                    plugin = fop.get_plugin(plugin_name)
+
                 plugin_list.append(
                     {
                         "name": plugin.name,
@@ -126,6 +157,7 @@ def download_plugin(ctx, url_or_repo, plugin_names=None, overwrite=False):
             plugin_names=plugin_names,
             overwrite=overwrite,
         )
+        clear_operator_cache()
 
         downloaded = fop.list_downloaded_plugins()
         return format_response(
@@ -160,6 +192,7 @@ def enable_plugin(ctx, plugin_name):
     """
     try:
         fop.enable_plugin(plugin_name)
+        clear_operator_cache()
         return format_response(
             {"message": ("Plugin %s enabled successfully" % plugin_name)},
             success=True,
@@ -183,6 +216,7 @@ def disable_plugin(ctx, plugin_name):
     """
     try:
         fop.disable_plugin(plugin_name)
+        clear_operator_cache()
         return format_response(
             {"message": ("Plugin %s disabled successfully" % plugin_name)},
             success=True,
@@ -227,7 +261,17 @@ def register_tools(registry):
                             "specified, lists all downloaded "
                             "plugins"
                         ),
-                    }
+                    },
+                    "detail": {
+                        "type": "boolean",
+                        "description": (
+                            "If false, return only plugin "
+                            "names, which is much faster. Use "
+                            "get_plugin_info for the details "
+                            "of a specific plugin"
+                        ),
+                        "default": True,
+                    },
                 },
             },
         ),
@@ -11,7 +11,14 @@ import logging
 import fiftyone as fo
 from mcp.types import Tool
 
-from .utils import SDK, _get_view, format_response, mcp_tool, safe_serialize
+from .utils import (
+    SDK,
+    _get_view,
+    format_response,
+    get_dataset,
+    mcp_tool,
+    safe_serialize,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -32,7 +39,7 @@ def add_samples(ctx, dataset_name, samples):
         a dict with the IDs of the added samples
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
 
         fo_samples = []
         for d in samples:
@@ -86,7 +93,7 @@ def set_values(ctx, dataset_name, field, values, key_field=None):
         a dict with the count of updated samples
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
 
         if isinstance(values, dict):
             ids = dataset.values("id")
@@ -135,7 +142,7 @@ def tag_samples(ctx, dataset_name, tags, view_stages=None, sample_ids=None):
         a dict with the count of tagged samples
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
 
         if sample_ids is not None:
             view = dataset.select(sample_ids)
@@ -176,7 +183,7 @@ def untag_samples(ctx, dataset_name, tags, view_stages=None, sample_ids=None):
         a dict with the count of untagged samples
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
 
         if sample_ids is not None:
             view = dataset.select(sample_ids)
@@ -216,7 +223,7 @@ def count_sample_tags(ctx, dataset_name):
         a dict mapping tags to their sample counts
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         tag_counts = dataset.count_sample_tags()
 
         return format_response(
@@ -12,7 +12,7 @@ import logging
 import fiftyone as fo
 from mcp.types import Tool
 
-from .utils import SDK, format_response, mcp_tool
+from .utils import SDK, format_response, get_dataset, mcp_tool
 
 
 logger = logging.getLogger(__name__)
@@ -73,7 +73,7 @@ def get_field_schema(ctx, dataset_name, include_private=False):
         a dict mapping field names to their schema information
     """
     try:
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         raw_schema = dataset.get_field_schema(include_private=include_private)
 
         schema = {
@@ -147,7 +147,7 @@ def add_sample_field(
                 ),
             )
 
-        dataset = fo.load_dataset(dataset_name)
+        dataset = get_dataset(dataset_name)
         ftype = _FIELD_TYPES[field_type]
 
         kwargs = {}
@@ -13,7 +13,7 @@ import logging
 import fiftyone as fo
 from mcp.types import Tool
 
-from .utils import SESSION, format_response, mcp_tool
+from .utils import SESSION, format_response, get_dataset, mcp_tool
 
 
 logger = logging.getLogger(__name__)
@@ -41,7 +41,7 @@ def launch_app(ctx, dataset_name=None, port=None):
     try:
         dataset = None
         if dataset_name:
-            dataset = fo.load_dataset(dataset_name)
+            dataset = get_dataset(dataset_name)
 
         session = fo.launch_app(dataset=dataset, port=port)
 
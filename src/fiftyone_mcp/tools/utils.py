@@ -6,12 +6,34 @@ Utility functions for FiftyOne MCP tools.
 |
 """
 
+from collections import OrderedDict
+import json
 import logging
+import os
+import threading
+import traceback
 
 import fiftyone as fo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _env_flag(name):
+    return os.environ.get(name, "").lower() not in ("", "0", "false")
+
+
+# Responses are compact by default; set FIFTYONE_MCP_INDENT=1 to
+# pretty-print them for debugging
+_INDENT_RESPONSES = _env_flag("FIFTYONE_MCP_INDENT")
+
+# Set FIFTYONE_MCP_DEBUG_TB=1 to include tracebacks in error responses
+_INCLUDE_TRACEBACKS = _env_flag("FIFTYONE_MCP_DEBUG_TB")
+
 # Runtime modes for MCP tools
 SDK = "sdk"
 APP = "app"
@@ -22,6 +44,14 @@ LOW = "low"
 OPERATOR = "operator"
 
 
+# Keeps recently used datasets alive. FiftyOne caches loaded datasets in a
+# weak-valued dict, so without a strong reference each tool call would
+# rebuild the dataset from the database
+_MAX_CACHED_DATASETS = 64
+_dataset_cache = OrderedDict()
+_dataset_cache_lock = threading.Lock()
+
+
 def mcp_tool(*modes, risk=LOW):
     """Tags an MCP tool with its supported runtime modes and risk level.
 
@@ -66,6 +96,31 @@ def mcp_tool(*modes, risk=LOW):
     return decorator
 
 
+def get_dataset(name):
+    """Loads the FiftyOne dataset with the given name.
+
+    The most recently used datasets are kept in memory so that repeated
+    loads reuse the existing instance rather than rebuilding it. The
+    instance is always reloaded from the database, so changes made by
+    other processes, including deletions, are picked up.
+
+    Args:
+        name: the name of the dataset
+
+    Returns:
+        a :class:`fiftyone.core.dataset.Dataset`
+    """
+    dataset = fo.load_dataset(name, reload=True)
+
+    with _dataset_cache_lock:
+        _dataset_cache[name] = dataset
+        _dataset_cache.move_to_end(name)
+        while len(_dataset_cache) > _MAX_CACHED_DATASETS:
+            _dataset_cache.popitem(last=False)
+
+    return dataset
+
+
 def _get_view(dataset, view_stages=None):
     """Builds a view from a dataset with optional serialized stages.
 
@@ -113,6 +168,152 @@ def format_response(data, success=True, error=None, **kwargs):
     return response
 
 
+def format_traceback():
+    """Formats the traceback of the exception currently being handled for
+    inclusion in an error response.
+
+    Tracebacks are only included if the ``FIFTYONE_MCP_DEBUG_TB``
+    environment variable is set; otherwise the traceback is only logged at
+    debug level.
+
+    Returns:
+        a traceback string, or None
+    """
+    if _INCLUDE_TRACEBACKS:
+        return traceback.format_exc()
+
+    logger.debug("Error traceback", exc_info=True)
+    return None
+
+
+def _json_default(obj):
+    # numpy arrays and scalars
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+
+    return str(obj)
+
+
+def _with_str_keys(obj):
+    if isinstance(obj, dict):
+        return {
+            (
+                k
+                if isinstance(k, (str, int, float, bool, type(None)))
+                else str(k)
+            ): _with_str_keys(v)
+            for k, v in obj.items()
+        }
+
+    if isinstance(obj, (list, tuple)):
+        return [_with_str_keys(v) for v in obj]
+
+    return obj
+
+
+def to_json(obj, indent=None):
+    """Serializes an object to a JSON string.
+
+    Uses ``orjson`` when it is installed, which is much faster than the
+    standard library encoder on large responses. Otherwise :mod:`json` is
+    used. Either way, numpy values are converted to native Python values,
+    non-string keys are stringified, and any other unsupported values are
+    converted via ``str()``.
+
+    Args:
+        obj: an object
+        indent (None): whether to pretty-print with two-space indentation.
+            By default, this is enabled only if the ``FIFTYONE_MCP_INDENT``
+            environment variable is set
+
+    Returns:
+        a JSON string
+    """
+    if indent is None:
+        indent = _INDENT_RESPONSES
+
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(
+                obj, default=_json_default, option=option
+            ).decode()
+        except TypeError:
+            pass
+
+    if indent:
+        kwargs = {"indent": 2}
+    else:
+        kwargs = {"separators": (",", ":")}
+
+    try:
+        return json.dumps(
+            obj, default=_json_default, ensure_ascii=False, **kwargs
+        )
+    except TypeError:
+        # Keys that json cannot encode, e.g. datetimes or numpy scalars
+        return json.dumps(
+            _with_str_keys(obj),
+            default=_json_default,
+            ensure_ascii=False,
+            **kwargs,
+        )
+
+
+def is_json_serializable(obj):
+    """Determines whether an object can be passed to :func:`to_json` as-is.
+
+    This runs in the C encoder, so it is much cheaper than
+    :func:`safe_serialize` for large objects that are already JSON-safe.
+
+    Args:
+        obj: an object
+
+    Returns:
+        True/False
+    """
+    if orjson is not None:
+        try:
+            orjson.dumps(
+                obj,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+            return True
+        except TypeError:
+            pass
+
+    try:
+        json.dumps(obj)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def json_safe(obj):
+    """Returns a JSON-serializable version of the given object.
+
+    Objects that are already JSON-serializable are returned as-is without
+    being walked in Python; anything else goes through
+    :func:`safe_serialize`.
+
+    Args:
+        obj: an object
+
+    Returns:
+        a JSON-serializable object
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+
+    if is_json_serializable(obj):
+        return obj
+
+    return safe_serialize(obj)
+
+
 def safe_serialize(obj):
     """Safely serializes FiftyOne objects to JSON-compatible formats.
 
@@ -140,31 +341,41 @@ def safe_serialize(obj):
     return str(obj)
 
 
-def dataset_to_summary(dataset):
+def dataset_to_summary(dataset, num_samples=None, schema=None):
     """Converts a FiftyOne dataset to a summary dictionary.
 
     Args:
         dataset: a :class:`fiftyone.core.dataset.Dataset`
+        num_samples (None): the number of samples in the dataset, if
+            already known. If None, it is counted
+        schema (None): the dataset's field schema, if already known. If
+            None, it is computed
 
     Returns:
         a summary dict
     """
+    if num_samples is None:
+        num_samples = len(dataset)
+
+    if schema is None:
+        schema = dataset.get_field_schema()
+
     summary = {
         "name": dataset.name,
         "media_type": dataset.media_type,
-        "num_samples": len(dataset),
+        "num_samples": num_samples,
         "persistent": dataset.persistent,
         "tags": dataset.tags,
         "sample_fields": {},
     }
 
-    for field_name, field in dataset.get_field_schema().items():
+    for field_name, field in schema.items():
         summary["sample_fields"][field_name] = {
             "type": str(type(field).__name__),
             "description": getattr(field, "description", None),
         }
 
-    if len(dataset) > 0:
+    if num_samples > 0:
         first_sample = dataset.first()
         summary["first_sample_id"] = first_sample.id
 
@@ -13,6 +13,8 @@ Upstream from ``claude-agent/agent/view_builder.py``.
 |
 """
 
+import functools
+
 import fiftyone as fo
 from fiftyone import ViewField as F
 
@@ -54,6 +56,11 @@ def build_view(dataset, stages):
     return view
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_expr(expr_str):
+    return compile(expr_str, "<expr>", "eval")
+
+
 def _eval_expr(expr_str):
     """Evaluate a FiftyOne ``F()`` expression string.
 
@@ -79,7 +86,7 @@ def _eval_expr(expr_str):
     if expr_str.startswith("`"):
         expr_str = expr_str.strip("`")
     try:
-        return eval(expr_str, _EVAL_GLOBALS, _EVAL_LOCALS)
+        return eval(_compile_expr(expr_str), _EVAL_GLOBALS, _EVAL_LOCALS)
     except Exception as e:
         raise ValueError("Invalid F() expression '%s': %s" % (expr_str, e))
 
@@ -7,6 +7,8 @@ Tests for dataset tools.
 """
 
 import json
+from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -44,6 +46,15 @@ def test_dataset():
         fo.delete_dataset(dataset_name)
 
 
+def _load_separate_handle(name, monkeypatch):
+    """Loads a dataset instance that is not FiftyOne's shared singleton,
+    as another process would.
+    """
+    with monkeypatch.context() as m:
+        m.setattr(fo.config, "singleton_cache", False)
+        return fo.load_dataset(name)
+
+
 class TestListDatasets:
     """Tests for list_datasets tool."""
 
@@ -75,6 +86,54 @@ class TestListDatasets:
         ]
         assert test_dataset.name in dataset_names
 
+    def test_list_datasets_metadata(self, test_dataset):
+        """Test that listed datasets include their metadata."""
+        result = list_datasets(None)
+
+        entry = next(
+            d
+            for d in result["data"]["datasets"]
+            if d["name"] == test_dataset.name
+        )
+        assert entry["num_samples"] == 10
+        assert entry["media_type"] == test_dataset.media_type
+        assert entry["persistent"] is True
+        assert entry["tags"] == []
+
+    def test_list_datasets_isolates_load_failures(self, monkeypatch):
+        """Test that one failing dataset does not abort the listing."""
+        infos = [
+            {
+                "name": name,
+                "media_type": "image",
+                "persistent": True,
+                "tags": [],
+            }
+            for name in ("bad", "good_a", "good_b")
+        ]
+
+        def _load_dataset(name):
+            if name == "bad":
+                raise RuntimeError("corrupt dataset")
+
+            dataset = MagicMock()
+            dataset.__len__.return_value = 3
+            return dataset
+
+        monkeypatch.setattr(fo, "list_datasets", lambda info=False: infos)
+        monkeypatch.setattr(fo, "load_dataset", _load_dataset)
+
+        result = list_datasets(None)
+
+        assert result["success"] is True
+        assert result["data"]["count"] == 3
+        bad, good_a, good_b = result["data"]["datasets"]
+        assert bad == {"name": "bad", "error": "corrupt dataset"}
+        assert good_a["name"] == "good_a"
+        assert good_a["num_samples"] == 3
+        assert good_b["name"] == "good_b"
+        assert good_b["num_samples"] == 3
+
 
 class TestLoadDataset:
     """Tests for load_dataset tool."""
@@ -104,6 +163,21 @@ class TestLoadDataset:
         assert "persistent" in result["data"]
         assert "tags" in result["data"]
 
+    def test_load_dataset_sees_external_changes(
+        self, test_dataset, monkeypatch
+    ):
+        """Test that changes made through another handle are visible."""
+        result = load_dataset(None, test_dataset.name)
+        assert result["data"]["tags"] == []
+
+        other = _load_separate_handle(test_dataset.name, monkeypatch)
+        assert other is not test_dataset
+        other.tags = ["external"]
+        other.save()
+
+        result = load_dataset(None, test_dataset.name)
+        assert result["data"]["tags"] == ["external"]
+
 
 class TestDatasetSummary:
     """Tests for dataset_summary tool."""
@@ -139,6 +213,40 @@ class TestDatasetSummary:
         assert "id" in fields
         assert "filepath" in fields
 
+    def test_dataset_summary_refreshes_after_edits(self, test_dataset):
+        """Test that cached summaries are invalidated by sample edits."""
+        result = dataset_summary(None, test_dataset.name)
+        assert result["data"]["stats"]["total_samples"] == 10
+
+        test_dataset.add_sample(fo.Sample(filepath="image_new.jpg"))
+        result = dataset_summary(None, test_dataset.name)
+        assert result["data"]["stats"]["total_samples"] == 11
+
+        test_dataset.take(1).tag_samples("edited")
+        result = dataset_summary(None, test_dataset.name)
+        assert result["data"]["value_counts"]["tags"]["edited"] == 1
+
+        test_dataset.delete_samples(test_dataset.first())
+        result = dataset_summary(None, test_dataset.name)
+        assert result["data"]["stats"]["total_samples"] == 10
+
+    def test_dataset_summary_refreshes_after_external_edits(
+        self, test_dataset, monkeypatch
+    ):
+        """Test that edits made through another handle invalidate the cache."""
+        result = dataset_summary(None, test_dataset.name)
+        assert result["data"]["stats"]["total_samples"] == 10
+
+        other = _load_separate_handle(test_dataset.name, monkeypatch)
+        other.delete_samples(other.first())
+        result = dataset_summary(None, test_dataset.name)
+        assert result["data"]["stats"]["total_samples"] == 9
+
+        other.tags = ["external"]
+        other.save()
+        result = dataset_summary(None, test_dataset.name)
+        assert result["data"]["tags"] == ["external"]
+
 
 class TestDatasetSummarySerializability:
     """Tests that dataset_summary output is always JSON-serializable."""
@@ -150,8 +258,6 @@ class TestDatasetSummarySerializability:
         ``TypeError: keys must be str, int, float, bool or None, not datetime``.
         After the fix all keys are coerced to str.
         """
-        from datetime import datetime
-
         dataset_name = "mcp_test_datetime_serialization"
         if fo.dataset_exists(dataset_name):
             fo.delete_dataset(dataset_name)
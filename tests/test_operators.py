@@ -18,6 +18,7 @@ from fiftyone_mcp.tools.operators import (
     get_operator_schema,
     execute_operator,
     register_tools,
+    clear_operator_cache,
     _strip_schema,
 )
 
@@ -92,6 +93,83 @@ class TestOperatorDiscovery:
         assert result["success"] is True
         assert result["data"]["count"] > 0
 
+    def test_list_operators_cached(self):
+        """Test that repeated listings are consistent across cache clears."""
+        first = list_operators(None)
+        second = list_operators(None)
+        assert second["data"] == first["data"]
+
+        clear_operator_cache()
+        third = list_operators(None)
+        assert third["data"] == first["data"]
+
+    def test_operator_cache_is_bounded(self, monkeypatch):
+        """Test that the operator cache evicts old and expired entries."""
+        from fiftyone_mcp.tools import operators
+
+        clear_operator_cache()
+        monkeypatch.setattr(operators, "_MAX_CACHED_OPERATOR_LOOKUPS", 2)
+
+        for i in range(3):
+            assert operators._get_cached(("test", i), lambda i=i: i) == i
+
+        assert list(operators._operator_cache) == [("test", 1), ("test", 2)]
+
+        monkeypatch.setattr(operators, "_OPERATOR_CACHE_TTL", 0)
+        operators._get_cached(("test", 3), lambda: 3)
+        assert list(operators._operator_cache) == [("test", 3)]
+
+        clear_operator_cache()
+
+    def test_list_operators_paging(self):
+        """Test paging through operators with limit and offset."""
+        full = list_operators(None)["data"]
+        page = list_operators(None, limit=2, offset=1)["data"]
+
+        assert page["count"] == 2
+        assert page["total"] == full["total"]
+        assert page["operators"] == full["operators"][1:3]
+
+    def test_list_operators_fields(self):
+        """Test projecting operators onto requested keys."""
+        result = list_operators(None, fields=["uri", "label"])
+
+        for op in result["data"]["operators"]:
+            assert set(op.keys()) == {"uri", "label"}
+
+    def test_list_operators_columnar(self):
+        """Test the columnar output format."""
+        objects = list_operators(None, fields=["uri", "label"])["data"]
+        columnar = list_operators(
+            None, fields=["uri", "label"], output_format="columnar"
+        )["data"]
+
+        assert columnar["operators"]["keys"] == ["uri", "label"]
+        rows = columnar["operators"]["rows"]
+        assert [dict(zip(["uri", "label"], r)) for r in rows] == (
+            objects["operators"]
+        )
+
+    def test_list_operators_invalid_paging(self):
+        """Test that invalid limit and offset values are rejected."""
+        result = list_operators(None, limit=0)
+        assert result["success"] is False
+        assert "limit" in result["error"]
+
+        result = list_operators(None, offset=-1)
+        assert result["success"] is False
+        assert "offset" in result["error"]
+
+    def test_list_operators_unknown_fields(self):
+        """Test that unknown fields and output formats are rejected."""
+        result = list_operators(None, fields=["uri", "bogus"])
+        assert result["success"] is False
+        assert "bogus" in result["error"]
+
+        result = list_operators(None, output_format="csv")
+        assert result["success"] is False
+        assert "output_format" in result["error"]
+
 
 class TestOperatorSchema:
     """Tests for operator schema operations."""
@@ -132,6 +210,21 @@ class TestOperatorSchema:
         assert result["success"] is False
         assert "not found" in result["error"]
 
+    def test_nonexistent_operator_miss_is_cached(self):
+        """Test that unknown operator URIs are cached as misses."""
+        from fiftyone_mcp.tools import operators
+
+        clear_operator_cache()
+        result = get_operator_schema(None, "@nonexistent/operator")
+
+        assert result["success"] is False
+        assert result["error"] == "Operator '@nonexistent/operator' not found"
+        assert operators._operator_cache[
+            ("get", "@nonexistent/operator")
+        ][1] is None
+
+        clear_operator_cache()
+
     def test_schema_has_properties(self, test_dataset):
         """Test that schema contains properties."""
         result = get_operator_schema(
@@ -171,6 +264,60 @@ class TestOperatorSchema:
         assert "dynamic" in result["data"]
         assert isinstance(result["data"]["dynamic"], bool)
 
+    def test_get_schema_cached(self, test_dataset):
+        """Test that schemas are cached per dataset state and params."""
+        from fiftyone_mcp.tools import operators
+
+        def _schema_keys():
+            return [k for k in operators._operator_cache if k[0] == "schema"]
+
+        uri = "@voxel51/operators/get_field_schema"
+        kwargs = dict(
+            params={"field_name": "tags"},
+            dataset_name=test_dataset.name,
+        )
+
+        clear_operator_cache()
+        first = get_operator_schema(None, uri, **kwargs)
+        second = get_operator_schema(None, uri, **kwargs)
+        assert first["data"]["dynamic"] is False
+        assert second["data"] == first["data"]
+        assert len(_schema_keys()) == 1
+
+        other = get_operator_schema(
+            None,
+            uri,
+            params={"field_name": "filepath"},
+            dataset_name=test_dataset.name,
+        )
+        assert other["success"] is True
+        assert len(_schema_keys()) == 2
+
+        test_dataset.add_sample_field("new_field", fo.StringField)
+        third = get_operator_schema(None, uri, **kwargs)
+        assert third["success"] is True
+        assert len(_schema_keys()) == 3
+
+        clear_operator_cache()
+
+    def test_get_schema_dynamic_not_cached(self, test_dataset):
+        """Test that dynamic operator schemas are always resolved."""
+        from fiftyone_mcp.tools import operators
+
+        clear_operator_cache()
+        result = get_operator_schema(
+            None,
+            "@voxel51/operators/edit_field_info",
+            params={"field_name": "tags"},
+            dataset_name=test_dataset.name,
+        )
+
+        assert result["success"] is True
+        assert result["data"]["dynamic"] is True
+        assert not [k for k in operators._operator_cache if k[0] == "schema"]
+
+        clear_operator_cache()
+
 
 class TestOperatorExecution:
     """Tests for operator execution operations."""
@@ -237,6 +237,45 @@ class TestPipelineAppMode:
         for stage_result in data["results"]:
             assert stage_result["triggered"] is True
 
+    @pytest.mark.asyncio
+    async def test_pipeline_skips_after_failure(self):
+        """Test that stages after a failure are skipped until always_run."""
+        ctx = MagicMock()
+        ctx.request_params = {"dataset_name": "test"}
+        ctx.trigger.side_effect = [RuntimeError("boom"), None]
+
+        uri = "@voxel51/operators/edit_field_info"
+        result = await execute_pipeline(
+            ctx,
+            stages=[
+                {"operator_uri": uri},
+                {"operator_uri": uri},
+                {"operator_uri": uri, "always_run": True},
+                {"operator_uri": uri},
+            ],
+        )
+
+        data = result["data"]
+        assert data["stages_failed"] == 1
+        assert data["stages_skipped"] == 2
+        assert data["stages_executed"] == 2
+        assert [r["skipped"] for r in data["results"]] == [
+            False,
+            True,
+            False,
+            True,
+        ]
+        assert data["results"][3]["name"] == "stage_3_edit_field_info"
+
+        ctx.trigger.side_effect = RuntimeError("boom")
+        result = await execute_pipeline(
+            ctx, stages=[{"operator_uri": uri}] * 3
+        )
+
+        data = result["data"]
+        assert data["stages_skipped"] == 2
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+
     @pytest.mark.asyncio
     async def test_pipeline_without_ctx_no_trigger(self):
         """Test that pipeline without ctx does not trigger."""
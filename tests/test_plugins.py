@@ -41,6 +41,17 @@ class TestListPlugins:
         assert result["success"] is True
         assert "plugins" in result["data"]
 
+    def test_list_plugin_names_only(self):
+        """Test that names-only listings match the detailed listings."""
+        for enabled in (None, True, False):
+            full = list_plugins(None, enabled=enabled)
+            result = list_plugins(None, enabled=enabled, detail=False)
+            assert result["success"] is True
+            assert result["data"]["count"] == full["data"]["count"]
+            assert result["data"]["plugins"] == [
+                {"name": p["name"]} for p in full["data"]["plugins"]
+            ]
+
 
 class TestGetPluginInfo:
     """Tests for get_plugin_info tool."""
@@ -70,6 +70,34 @@ class TestToolRegistry:
         names = {t.name for t in tools}
         assert names == {"alpha", "beta", "gamma"}
 
+    def test_list_tools_cached_until_register(self):
+        """Test that the schema list is reused until a new tool is added."""
+        reg = ToolRegistry()
+        reg.register(
+            Tool(
+                name="alpha",
+                description="alpha",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            _dummy_handler,
+        )
+
+        first = reg.list_tools()
+        assert reg.list_tools() is first
+
+        reg.register(
+            Tool(
+                name="beta",
+                description="beta",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            _dummy_handler,
+        )
+
+        second = reg.list_tools()
+        assert second is not first
+        assert {t.name for t in second} == {"alpha", "beta"}
+
     @pytest.mark.asyncio
     async def test_call_sync_handler(self):
         """Test calling a sync handler through the registry."""
@@ -116,6 +144,31 @@ class TestToolRegistry:
         assert data["success"] is True
         assert data["data"]["async"] is True
 
+    @pytest.mark.asyncio
+    async def test_sync_handler_runs_off_event_loop(self):
+        """Test that sync handlers do not block the event loop thread."""
+        import threading
+
+        def thread_handler(ctx, **kwargs):
+            return {"success": True, "data": threading.get_ident()}
+
+        reg = ToolRegistry()
+        reg.register(
+            Tool(
+                name="thread_tool",
+                description="thread",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                },
+            ),
+            thread_handler,
+        )
+
+        result = await reg.call_tool("thread_tool", {})
+        data = json.loads(result.content[0].text)
+        assert data["data"] != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_call_unknown_tool(self):
         """Test calling a non-existent tool."""
@@ -152,6 +205,52 @@ class TestToolRegistry:
         assert data["success"] is False
         assert "boom" in data["error"]
 
+    @pytest.mark.asyncio
+    async def test_call_serializes_numpy_and_non_str_keys(self):
+        """Test that numpy values and non-string keys are serialized."""
+        import numpy as np
+
+        def numpy_handler(ctx, **kwargs):
+            return {
+                "success": True,
+                "data": {"mean": np.float64(0.5), "counts": {1: np.int64(3)}},
+            }
+
+        reg = ToolRegistry()
+        reg.register(
+            Tool(
+                name="numpy_tool",
+                description="numpy",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                },
+            ),
+            numpy_handler,
+        )
+
+        result = await reg.call_tool("numpy_tool", {})
+        data = json.loads(result.content[0].text)
+        assert data["success"] is True
+        assert data["data"]["mean"] == 0.5
+        assert data["data"]["counts"] == {"1": 3}
+
+    @pytest.mark.asyncio
+    async def test_call_serializes_numpy_without_orjson(self, monkeypatch):
+        """Test that the stdlib fallback handles numpy values and keys."""
+        import numpy as np
+
+        from fiftyone_mcp.tools import utils
+
+        monkeypatch.setattr(utils, "orjson", None)
+
+        assert utils.to_json(
+            {"mean": np.float64(0.5), "counts": {np.int64(1): 3}}
+        ) == '{"mean":0.5,"counts":{"1":3}}'
+        assert json.loads(utils.to_json({"arr": np.arange(3)})) == {
+            "arr": [0, 1, 2]
+        }
+
     @pytest.mark.asyncio
     async def test_call_with_ctx(self):
         """Test that ctx is passed to the handler."""
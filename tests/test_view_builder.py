@@ -90,6 +90,13 @@ class TestEvalExpr:
         with pytest.raises(ValueError):
             _eval_expr("__import__('os')")
 
+    def test_repeated_expression_is_fresh(self):
+        """Test that repeat evaluations return independent expressions."""
+        first = _eval_expr('F("score") > 0.5')
+        second = _eval_expr('F("score") > 0.5')
+        assert first is not second
+        assert first.to_mongo() == second.to_mongo()
+
 
 class TestResolveFieldOrExpr:
     """Tests for _resolve_field_or_expr."""